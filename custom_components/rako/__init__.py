@@ -1,13 +1,20 @@
 """The Rako integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from xml.parsers.expat import ExpatError
+
+import aiohttp
+import python_rako
+from python_rako.model import LevelCache, SceneCache
 
 from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
 from homeassistant.components.scene import DOMAIN as SCENE_DOMAIN
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_MAC, CONF_NAME, CONF_PORT
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
 
 from .bridge import RakoBridge
@@ -37,9 +44,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         name=entry.data[CONF_NAME],
     )
 
+    # Discover once per entry; the light and scene platforms share the result.
+    # The cache state comes over UDP, so fetch it alongside the XML discovery;
+    # the task group cancels the other fetch as soon as one of them fails.
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            lights_task = task_group.create_task(_async_discover_lights(rako_bridge))
+            cache_task = task_group.create_task(_async_get_cache_state(rako_bridge))
+    except ExceptionGroup as ex_group:
+        # Surface the first failure on its own rather than as a group
+        ex = ex_group.exceptions[0]
+        if isinstance(ex, (ExpatError, aiohttp.ClientError, OSError)):
+            raise ConfigEntryNotReady(
+                f"Cannot fetch lights from Rako bridge: {ex}"
+            ) from ex
+        raise ex from None
+
+    lights = lights_task.result()
+    rako_bridge.level_cache, rako_bridge.scene_cache = cache_task.result()
+
     hass.data.setdefault(DOMAIN, {})
     rako_domain_entry_data: RakoDomainEntryData = {
         "rako_bridge_client": rako_bridge,
+        "lights": lights,
+        "rooms": [
+            light for light in lights if isinstance(light, python_rako.RoomLight)
+        ],
     }
     hass.data[DOMAIN][rako_bridge.mac] = rako_domain_entry_data
 
@@ -48,6 +78,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_discover_lights(bridge: RakoBridge) -> list[python_rako.Light]:
+    """Fetch and parse the bridge's light list."""
+    # Retry light discovery if XML parsing fails (can happen with concurrent requests)
+    max_attempts = 5
+    for attempt in range(1, max_attempts):
+        try:
+            return await _async_fetch_lights(bridge)
+        except (ExpatError, aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            backoff = min(0.25 * 2 ** (attempt - 1), 2.0)
+            _LOGGER.warning(
+                "Light discovery failed (attempt %d/%d): %s - retrying in %.2fs...",
+                attempt,
+                max_attempts,
+                ex,
+                backoff,
+            )
+            await asyncio.sleep(backoff)
+    # Last attempt; a failure here propagates to entry setup
+    return await _async_fetch_lights(bridge)
+
+
+async def _async_fetch_lights(bridge: RakoBridge) -> list[python_rako.Light]:
+    """Fetch and parse the bridge's light list once."""
+    async with asyncio.timeout(10):
+        return [light async for light in bridge.discover_lights(bridge.session)]
+
+
+async def _async_get_cache_state(bridge: RakoBridge) -> tuple[LevelCache, SceneCache]:
+    """Fetch the bridge's level and scene caches."""
+    async with asyncio.timeout(10):
+        return await bridge.get_cache_state()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, [LIGHT_DOMAIN, SCENE_DOMAIN])
@@ -1,11 +1,15 @@
 """Module representing a Rako Bridge."""
 from __future__ import annotations
 
+from functools import cached_property
 import logging
 
+import aiohttp
 from python_rako.bridge import Bridge
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import DOMAIN
 from .model import RakoDomainEntryData
@@ -29,3 +33,21 @@ class RakoBridge(Bridge):
         super().__init__(host, port, name, mac)
         self.entry_id = entry_id
         self.hass = hass
+        self._device_info_cache: dict[tuple[str, int], DeviceInfo] = {}
+
+    @cached_property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session used to talk to the bridge."""
+        return async_get_clientsession(self.hass)
+
+    def get_room_device_info(self, room_id: int, room_title: str) -> DeviceInfo:
+        """Return the device information shared by everything in a room."""
+        key = (self.mac, room_id)
+        if (device_info := self._device_info_cache.get(key)) is None:
+            device_info = self._device_info_cache[key] = {
+                "identifiers": {(DOMAIN, f"{self.mac}_{room_id}")},
+                "name": room_title,
+                "manufacturer": "Rako",
+                "via_device": (DOMAIN, self.mac),
+            }
+        return device_info
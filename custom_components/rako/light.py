@@ -1,7 +1,11 @@
 """Platform for light integration."""
 from __future__ import annotations
 
+from abc import abstractmethod
 import asyncio
+from collections.abc import Callable
+from datetime import datetime
+from functools import cached_property
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -15,10 +19,10 @@ from homeassistant.components.light import (
     LightEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo, Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
 from .const import DOMAIN
 from .util import create_unique_id
@@ -29,6 +33,9 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Window in seconds during which consecutive brightness changes are merged
+BRIGHTNESS_COALESCE_DELAY = 0.05
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -40,63 +47,58 @@ async def async_setup_entry(
     bridge = rako_domain_entry_data["rako_bridge_client"]
 
     hass_lights: list[Entity] = []
-    session = async_get_clientsession(hass)
-
-    bridge.level_cache, bridge.scene_cache = await bridge.get_cache_state()
-
-    # Retry light discovery if XML parsing fails (can happen with concurrent requests)
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            async for light in bridge.discover_lights(session):
-                if isinstance(light, python_rako.ChannelLight):
-                    hass_light: RakoLight = RakoChannelLight(bridge, light)
-                elif isinstance(light, python_rako.RoomLight):
-                    hass_light = RakoRoomLight(bridge, light)
-                else:
-                    continue
-
-                hass_lights.append(hass_light)
-            break  # Success - exit retry loop
-        except Exception as ex:
-            if attempt < max_retries - 1:
-                _LOGGER.warning(
-                    "Light discovery failed (attempt %d/%d): %s - retrying...",
-                    attempt + 1,
-                    max_retries,
-                    ex,
-                )
-                await asyncio.sleep(1)  # Wait before retry
-            else:
-                _LOGGER.error("Light discovery failed after %d attempts: %s", max_retries, ex)
-                raise
 
-    async_add_entities(hass_lights, True)
+    # Read each room's cached scene once; all lights in the room share it
+    room_scenes = {
+        room.room_id: bridge.scene_cache.get(room.room_id, 0)
+        for room in rako_domain_entry_data["rooms"]
+    }
+
+    for light in rako_domain_entry_data["lights"]:
+        light_factory = _LIGHT_FACTORY_MAP.get(type(light))
+        if light_factory is None:
+            continue
+
+        hass_lights.append(
+            light_factory(bridge, light, room_scenes.get(light.room_id, 0))
+        )
+
+    async_add_entities(hass_lights)
 
 
 class RakoLight(LightEntity):
     """Representation of a Rako Light."""
 
+    __slots__ = (
+        "bridge",
+        "_light",
+        "_brightness",
+        "_available",
+        "_pending_brightness",
+        "_confirmed_brightness",
+        "_cancel_flush",
+        "_send_lock",
+    )
+
     _attr_supported_color_modes = {ColorMode.BRIGHTNESS}
     _attr_color_mode = ColorMode.BRIGHTNESS
     _attr_assumed_state = True  # State is unreliable due to manual control
 
-    def __init__(self, bridge: RakoBridge, light: python_rako.Light) -> None:
+    def __init__(
+        self, bridge: RakoBridge, light: python_rako.Light, initial_brightness: int
+    ) -> None:
         """Initialize a RakoLight."""
         self.bridge = bridge
         self._light = light
-        self._brightness = self._init_get_brightness_from_cache()
+        self._brightness = initial_brightness
         self._available = True
+        self._pending_brightness: int | None = None
+        # Last brightness the bridge accepted, restored when a command fails
+        self._confirmed_brightness = self._brightness
+        self._cancel_flush: CALLBACK_TYPE | None = None
+        self._send_lock = asyncio.Lock()
 
-    @property
-    def name(self) -> str:
-        """Return the display name of this light."""
-        raise NotImplementedError()
-
-    def _init_get_brightness_from_cache(self) -> int:
-        raise NotImplementedError()
-
-    @property
+    @cached_property
     def unique_id(self) -> str:
         """Light's unique ID."""
         return create_unique_id(
@@ -131,11 +133,81 @@ class RakoLight(LightEntity):
         """Return true if light is on."""
         return self.brightness > 0
 
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn on the light."""
+        brightness = kwargs.get(ATTR_BRIGHTNESS, 255)
+        _LOGGER.debug(
+            "Turn on %s (room=%s, channel=%s) with brightness=%s",
+            self.name,
+            self._light.room_id,
+            self._light.channel_id,
+            brightness,
+        )
+
+        # Optimistically update state, then coalesce rapid changes (e.g. a
+        # slider drag) so only the latest brightness is sent to the bridge
+        self._brightness = brightness
+        self._pending_brightness = brightness
+        self.async_write_ha_state()
+
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+        self._cancel_flush = async_call_later(
+            self.hass, BRIGHTNESS_COALESCE_DELAY, self._async_flush
+        )
+
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the light."""
         await self.async_turn_on(brightness=0)
 
-    @property
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop any brightness change that has not been sent yet."""
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+        self._pending_brightness = None
+
+    async def _async_flush(self, _now: datetime) -> None:
+        """Send the latest pending brightness to the bridge."""
+        self._cancel_flush = None
+        # Sends are serialized so an older brightness can never land last;
+        # a flush queued behind an in-flight one picks up the newest value
+        async with self._send_lock:
+            brightness = self._pending_brightness
+            if brightness is None:
+                return
+            self._pending_brightness = None
+
+            try:
+                await asyncio.wait_for(
+                    self._async_send_brightness(brightness), timeout=3.0
+                )
+                _LOGGER.debug("Command successful for %s", self.name)
+                self._confirmed_brightness = brightness
+                self._available = True
+
+            except (RakoBridgeError, OSError) as ex:
+                _LOGGER.debug("Error updating %s: %s", self.name, ex)
+                was_available = self._available
+                if was_available:
+                    _LOGGER.error("An error occurred while updating the Rako Light")
+                self._available = False
+                # Revert state on error, unless a newer change is already queued;
+                # skip the write entirely when nothing visible changed
+                reverted = (
+                    self._pending_brightness is None
+                    and self._brightness != self._confirmed_brightness
+                )
+                if reverted:
+                    self._brightness = self._confirmed_brightness
+                if reverted or was_available:
+                    self.async_write_ha_state()
+
+    @abstractmethod
+    async def _async_send_brightness(self, brightness: int) -> None:
+        """Send a brightness command for this light to the bridge."""
+
+    @cached_property
     def device_info(self) -> DeviceInfo:
         """Return device information about this Rako Light."""
         return {
@@ -150,100 +222,76 @@ class RakoLight(LightEntity):
 class RakoRoomLight(RakoLight):
     """Representation of a Rako Room Light."""
 
-    def __init__(self, bridge: RakoBridge, light: python_rako.RoomLight) -> None:
+    __slots__ = ()
+
+    def __init__(
+        self,
+        bridge: RakoBridge,
+        light: python_rako.RoomLight,
+        initial_brightness: int,
+    ) -> None:
         """Initialize a RakoLight."""
-        super().__init__(bridge, light)
+        super().__init__(bridge, light, initial_brightness)
         self._light: python_rako.RoomLight = light
 
-    def _init_get_brightness_from_cache(self) -> int:
-        scene_of_room = self.bridge.scene_cache.get(self._light.room_id, 0)
-        brightness: int = convert_to_brightness(scene_of_room)
-        return brightness
+    @classmethod
+    def from_cache(
+        cls, bridge: RakoBridge, light: python_rako.RoomLight, scene_of_room: int
+    ) -> RakoRoomLight:
+        """Create a room light lit to match the room's cached scene."""
+        return cls(bridge, light, convert_to_brightness(scene_of_room))
 
-    @property
+    @cached_property
     def name(self) -> str:
         """Return the display name of this light."""
         room_title: str = self._light.room_title
         return room_title
 
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn on the light."""
-        brightness = kwargs.get(ATTR_BRIGHTNESS, 255)
-
-        # Optimistically update state before sending command
-        self._brightness = brightness
-        self.async_write_ha_state()
-
-        try:
-            scene = convert_to_scene(brightness)
-            await asyncio.wait_for(
-                self.bridge.set_room_scene(self._light.room_id, scene), timeout=3.0
-            )
-            self._available = True
-
-        except (RakoBridgeError, asyncio.TimeoutError):
-            if self._available:
-                _LOGGER.error("An error occurred while updating the Rako Light")
-            self._available = False
-            # Revert state on error
-            self.async_write_ha_state()
-            return
+    async def _async_send_brightness(self, brightness: int) -> None:
+        scene = convert_to_scene(brightness)
+        await self.bridge.set_room_scene(self._light.room_id, scene)
 
 
 class RakoChannelLight(RakoLight):
     """Representation of a Rako Channel Light."""
 
-    def __init__(self, bridge: RakoBridge, light: python_rako.ChannelLight) -> None:
+    __slots__ = ()
+
+    def __init__(
+        self,
+        bridge: RakoBridge,
+        light: python_rako.ChannelLight,
+        initial_brightness: int,
+    ) -> None:
         """Initialize a RakoLight."""
-        super().__init__(bridge, light)
+        super().__init__(bridge, light, initial_brightness)
         self._light: python_rako.ChannelLight = light
 
-    def _init_get_brightness_from_cache(self) -> int:
-        scene_of_room = self.bridge.scene_cache.get(self._light.room_id, 0)
-        brightness: int = self.bridge.level_cache.get_channel_level(
-            self._light.room_channel, scene_of_room
+    @classmethod
+    def from_cache(
+        cls, bridge: RakoBridge, light: python_rako.ChannelLight, scene_of_room: int
+    ) -> RakoChannelLight:
+        """Create a channel light at its cached level for the room's scene."""
+        brightness: int = bridge.level_cache.get_channel_level(
+            light.room_channel, scene_of_room
         )
-        return brightness
+        return cls(bridge, light, brightness)
 
-    @property
+    @cached_property
     def name(self) -> str:
         """Return the display name of this light."""
         return f"{self._light.room_title} - {self._light.channel_name}"
 
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn on the light."""
-        brightness = kwargs.get(ATTR_BRIGHTNESS, 255)
-        _LOGGER.debug(
-            "Turn on %s (room=%s, channel=%s) with brightness=%s",
-            self.name,
-            self._light.room_id,
-            self._light.channel_id,
-            brightness,
+    async def _async_send_brightness(self, brightness: int) -> None:
+        await self.bridge.set_channel_brightness(
+            self._light.room_id, self._light.channel_id, brightness
         )
 
-        # Optimistically update state before sending command
-        self._brightness = brightness
-        self.async_write_ha_state()
 
-        try:
-            await asyncio.wait_for(
-                self.bridge.set_channel_brightness(
-                    self._light.room_id, self._light.channel_id, brightness
-                ),
-                timeout=3.0,
-            )
-            _LOGGER.debug("Command successful for %s", self.name)
-            self._available = True
-
-        except (RakoBridgeError, asyncio.TimeoutError) as ex:
-            _LOGGER.error(
-                "Error updating %s: %s",
-                self.name,
-                ex,
-            )
-            if self._available:
-                _LOGGER.error("An error occurred while updating the Rako Light")
-            self._available = False
-            # Revert state on error
-            self.async_write_ha_state()
-            return
+# Each factory takes (bridge, light, scene_of_room) for its own light type
+_LIGHT_FACTORY_MAP: dict[
+    type[python_rako.Light], Callable[[RakoBridge, Any, int], RakoLight]
+] = {
+    python_rako.ChannelLight: RakoChannelLight.from_cache,
+    python_rako.RoomLight: RakoRoomLight.from_cache,
+}
@@ -4,6 +4,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, TypedDict
 
 if TYPE_CHECKING:
+    import python_rako
+
     from .bridge import RakoBridge
 
 
@@ -11,3 +13,5 @@ class RakoDomainEntryData(TypedDict):
     """A single Rako config entry's data."""
 
     rako_bridge_client: RakoBridge
+    lights: list[python_rako.Light]
+    rooms: list[python_rako.RoomLight]
@@ -2,16 +2,17 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Mapping
+from functools import cached_property
 import logging
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
-import python_rako
 from python_rako.exceptions import RakoBridgeError
 
 from homeassistant.components.scene import Scene
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -30,12 +31,16 @@ _LOGGER = logging.getLogger(__name__)
 # Scene 2 = 75% brightness
 # Scene 3 = 50% brightness
 # Scene 4 = 25% brightness
-RAKO_SCENES = {
-    1: {"name": "Scene 1", "description": "100% brightness"},
-    2: {"name": "Scene 2", "description": "75% brightness"},
-    3: {"name": "Scene 3", "description": "50% brightness"},
-    4: {"name": "Scene 4", "description": "25% brightness"},
+RAKO_SCENES: dict[int, Mapping[str, str]] = {
+    1: MappingProxyType({"name": "Scene 1", "description": "100% brightness"}),
+    2: MappingProxyType({"name": "Scene 2", "description": "75% brightness"}),
+    3: MappingProxyType({"name": "Scene 3", "description": "50% brightness"}),
+    4: MappingProxyType({"name": "Scene 4", "description": "25% brightness"}),
 }
+# Flattened once so per-room scene creation iterates a plain tuple
+_RAKO_SCENE_ENTRIES: tuple[tuple[int, Mapping[str, str]], ...] = tuple(
+    RAKO_SCENES.items()
+)
 
 
 async def async_setup_entry(
@@ -47,36 +52,36 @@ async def async_setup_entry(
     rako_domain_entry_data: RakoDomainEntryData = hass.data[DOMAIN][entry.unique_id]
     bridge = rako_domain_entry_data["rako_bridge_client"]
 
-    hass_scenes: list[Scene] = []
-    session = async_get_clientsession(hass)
+    # Create a scene entity for each Rako scene (1-4) in every room; rooms
+    # come from the discovery already done during entry setup
+    hass_scenes: list[Scene] = [
+        RakoScene(bridge, room.room_id, room.room_title, scene_number, scene_info)
+        for room in rako_domain_entry_data["rooms"]
+        for scene_number, scene_info in _RAKO_SCENE_ENTRIES
+    ]
 
-    # Discover rooms from the bridge
-    async for light in bridge.discover_lights(session):
-        # Only create scene entities for RoomLight, not individual ChannelLight
-        if isinstance(light, python_rako.RoomLight):
-            room_id = light.room_id
-            room_title = light.room_title
-
-            # Create a scene entity for each Rako scene (1-4)
-            for scene_number, scene_info in RAKO_SCENES.items():
-                hass_scene = RakoScene(
-                    bridge, room_id, room_title, scene_number, scene_info
-                )
-                hass_scenes.append(hass_scene)
-
-    async_add_entities(hass_scenes, True)
+    async_add_entities(hass_scenes)
 
 
 class RakoScene(Scene):
     """Representation of a Rako Scene."""
 
+    __slots__ = (
+        "bridge",
+        "_room_id",
+        "_room_title",
+        "_scene_number",
+        "_scene_info",
+        "_available",
+    )
+
     def __init__(
         self,
         bridge: RakoBridge,
         room_id: int,
         room_title: str,
         scene_number: int,
-        scene_info: dict[str, str],
+        scene_info: Mapping[str, str],
     ) -> None:
         """Initialize a RakoScene."""
         self.bridge = bridge
@@ -86,12 +91,12 @@ class RakoScene(Scene):
         self._scene_info = scene_info
         self._available = True
 
-    @property
+    @cached_property
     def name(self) -> str:
         """Return the display name of this scene."""
         return f"{self._room_title} - {self._scene_info['name']}"
 
-    @property
+    @cached_property
     def unique_id(self) -> str:
         """Scene's unique ID."""
         return create_unique_id(self.bridge.mac, self._room_id, self._scene_number)
@@ -101,15 +106,10 @@ class RakoScene(Scene):
         """Return True if entity is available."""
         return self._available
 
-    @property
+    @cached_property
     def device_info(self) -> DeviceInfo:
         """Return device information about this Rako Scene."""
-        return {
-            "identifiers": {(DOMAIN, f"{self.bridge.mac}_{self._room_id}")},
-            "name": self._room_title,
-            "manufacturer": "Rako",
-            "via_device": (DOMAIN, self.bridge.mac),
-        }
+        return self.bridge.get_room_device_info(self._room_id, self._room_title)
 
     async def async_activate(self, **kwargs: Any) -> None:
         """Activate the scene."""